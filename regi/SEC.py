@@ -1,16 +1,19 @@
-import json, csv, os, sys, re 
+import os, sys
 import datetime
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent, FakeUserAgent
-import requests
-from sec_cik_mapper import StockMapper 
+import asyncio
+import functools
+from types import MappingProxyType
 from typing import Dict
 
-# Add modules from base repo
+# Add modules from base repo (only needed when this file is run as a script, not imported from regi)
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
 
 from regi.session import RequestSession
+from regi.utils import TS_FMT, json_dumps, json_loads
+
+MAX_CONCURRENCY = 8  # Stay under SEC's fair-access limit of 10 requests/second
 
 
 def save_json(spath: str, data: Dict) -> None:
@@ -21,8 +24,41 @@ def save_json(spath: str, data: Dict) -> None:
     :param data: The json data to store into a file
     """
     print(f"\n[OMNI] - {datetime.datetime.now()} - Saving data in {spath}...\n")
-    with open(spath, 'w+') as f:
-        json.dump(data, f)
+    with open(spath, 'wb') as f:
+        f.write(json_dumps(data))
+
+@functools.lru_cache(maxsize=1)
+def load_cik_map() -> MappingProxyType:
+    """
+        Load the ticker -> CIK mapping from config/cik.json. The file is only read once per process,
+        and every SEC instance shares the same read-only view of it.
+
+    :return: A read-only mapping of ticker to 10-digit CIK string
+    """
+    jpath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config/cik.json")
+    with open(jpath, 'rb') as f:
+        cik_map = json_loads(f.read())
+ # SEC URLs need the zero-padded 10-digit form, so pad once here rather than at every call site
+    return MappingProxyType({ticker: str(cik).zfill(10) for ticker, cik in cik_map.items()})
+
+def xbrl_url(cik: str) -> str:
+    """
+        Build the XBRL company-concept URL (AccountsPayableCurrent) for a CIK.
+
+    :param cik: The 10-digit CIK string
+    :return: The data.sec.gov URL for that company's accounts payable concept
+    """
+    return f"https://data.sec.gov/api/xbrl/companyconcept/CIK{cik}/us-gaap/AccountsPayableCurrent.json"
+
+@functools.lru_cache(maxsize=1)
+def get_request_session() -> RequestSession:
+    """
+        Build the RequestSession used for SEC requests. It is created once per process, so every SEC instance
+        reuses the same keep-alive connections to data.sec.gov instead of handshaking again.
+
+    :return: The shared RequestSession
+    """
+    return RequestSession(pool_maxsize=MAX_CONCURRENCY)
 
 class SEC():
     """
@@ -33,31 +69,49 @@ class SEC():
         self.start = datetime.datetime.now()
 
      # Configuration
-        self.reqsesh = RequestSession()
+        self.reqsesh = get_request_session()
+        self.max_concurrency = MAX_CONCURRENCY
         self.url_template = "https://data.sec.gov/submissions/CIK##########.json"
-        self.url_xbrl = "https://data.sec.gov/api/xbrl/companyconcept/CIK##########/us-gaap/AccountsPayableCurrent.json"
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.data_dir = os.path.join(self.base_dir, "data")
-        jpath = os.path.join(self.base_dir, "config/cik.json")
-        self.cik_map = None
-        with open(jpath, 'r') as f:
-            self.cik_map = json.load(f)
+        self.cik_map = load_cik_map()
+
+        self.cik_list = self.lookup_ciks(['PLTR', 'BABA', 'VALE', 'WMT', 'SMCI'])
+
+     # Key = Ticker; Value = CIK
+        #self.ticker_mapping = pull_json(jpath) 
 
-        self.cik_list = [self.cik_map[ticker] for ticker in ['PLTR', 'BABA', 'VALE', 'WMT', 'SMCI']]
+    def lookup_ciks(self, tickers: list) -> list:
+        """
+        Map tickers to their CIKs with a single dict probe per ticker, skipping any the SEC map doesn't know.
+        Tickers are matched case-insensitively (the SEC map is keyed by upper-case symbols).
+
+        :param tickers: Ticker symbols, e.g. ['PLTR', 'wmt']
+        :return: The CIKs of the known tickers, in the order given
+        """
+        tickers = [ticker.upper() for ticker in tickers]
+        cik_list = [cik for ticker in tickers if (cik := self.cik_map.get(ticker)) is not None]
+        for ticker in set(tickers) - self.cik_map.keys():
+            print(f"\n[SEC] - No CIK found for ticker: {ticker}")
+        return cik_list
+
+    def warmup(self) -> None:
+        """
+        Pull the accounts payable records and filings for the default watchlist (self.cik_list).
+        Nothing is fetched when SEC() is constructed, so callers that want this data invoke it explicitly.
+        """
         print(f"Printing out the following tickers' CIK numbers: {self.cik_list}")
-        for cik in self.cik_list:
+        gaap_records = asyncio.run(self.extract_data_many(self.cik_list))
+        for cik, gaap_record in zip(self.cik_list, gaap_records):
             print(f"{cik}")
-            gaap_record = self.fetch_accounts_payable(cik)
             if gaap_record:
                 gaap_record_cleaned = gaap_record.content.decode('utf-8')
                 print(gaap_record_cleaned)
-            
+            else:
+                print(f"\n[SEC] - No accounts payable data found...")
 
         self.fetch_sec_filings(self.cik_list)
 
-     # Key = Ticker; Value = CIK
-        #self.ticker_mapping = pull_json(jpath) 
-
     def fetch_sec_filings(self, cik_list: list[str]) -> None:
         """
         Fetch filings for a list of companies and save the aggregated data.
@@ -65,8 +119,8 @@ class SEC():
         :param cik_list: List of 10-digit CIK strings.
         """
         aggregated_filings = {}
-        for cik in cik_list:
-            filings_data = self.extract_data(cik)
+        responses = asyncio.run(self.extract_data_many(cik_list))
+        for cik, filings_data in zip(cik_list, responses):
             print(filings_data, "\n\n")
             if filings_data:
                 aggregated_filings[cik] = filings_data
@@ -74,7 +128,8 @@ class SEC():
                 print(f"No data found for CIK: {cik}")
 
         # Save aggregated data
-        spath = os.path.join(self.base_dir, f'data/filings_{datetime.datetime.now().strftime('%Y%m%d')}_{datetime.datetime.now().strftime('%H%M%S')}.json')
+        timestamp = datetime.datetime.now().strftime(TS_FMT)
+        spath = os.path.join(self.base_dir, f'data/filings_{timestamp}.json')
         #save_json(spath, aggregated_filings)
 
     def fetch_accounts_payable(self, cik: str) -> bytes:
@@ -94,13 +149,29 @@ class SEC():
     def extract_data(self, cik: str) -> bytes:
         print(f"\n[REGI] - Extracting data for the following CIK (Central Index Key): {cik}\n")
 #        url = self.url_template.replace('##########', cik)
-        url = self.url_xbrl.replace('##########', cik)
+        url = xbrl_url(cik)
 
         print(url)
         res = self.reqsesh.get(url)
 
         return res
 
+    async def extract_data_many(self, cik_list: list[str]) -> list:
+        """
+        Run extract_data for every CIK concurrently, with at most max_concurrency requests in flight.
+
+        :param cik_list: List of 10-digit CIK strings.
+        :return: The responses, in the same order as cik_list.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_extract(cik: str):
+            async with semaphore:
+                return await asyncio.to_thread(self.extract_data, cik)
+
+        return await asyncio.gather(*(bounded_extract(cik) for cik in cik_list))
+
 
 if __name__=="__main__":
-    sec = SEC()
\ No newline at end of file
+    sec = SEC()
+    sec.warmup()
\ No newline at end of file
@@ -15,31 +15,27 @@ Usage:
 
 import os
 import sys
-import time
 import argparse
-import json
 import logging
 import datetime
 import pandas as pd
-import sqlite3
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Ensure we can import from the regi package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Ensure we can import from the regi package (only needed when this file is run as a script)
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import REGI modules
-from regi.news_scraper import RegiNewsScraper, fetch_yahoo_finance_rss, request_to_reuters, save_json
-from regi.SEC import SEC
-from regi.crypto import Crypto
+# Import REGI modules (the collectors are imported in the collect_* methods, so analysis-only runs skip
+# loading bs4/feedparser)
 from regi.omnidb import OmniDB
-from regi.session import RequestSession
+from regi.utils import TS_FMT, json_dumps, json_loads
 
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
     format='[%(asctime)s] - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(f'logs/analysis_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
+        logging.FileHandler(f'logs/analysis_{datetime.datetime.now().strftime(TS_FMT)}.log'),
         logging.StreamHandler()
     ]
 )
@@ -50,7 +46,14 @@ os.makedirs('logs', exist_ok=True)
 os.makedirs('data', exist_ok=True)
 os.makedirs('reports', exist_ok=True)
 
+def load_json(jpath: str):
+    """Read and parse a JSON file"""
+    with open(jpath, 'rb') as f:
+        return json_loads(f.read())
+
 class FinanceAnalyzer:
+    __slots__ = ('db', 'report_data')
+
     def __init__(self):
         self.db = OmniDB()
         self.report_data = {
@@ -62,10 +65,21 @@ class FinanceAnalyzer:
         }
     
     def collect_all_data(self):
-        """Collect data from all sources"""
+        """Collect data from all sources (the news, SEC and crypto pulls are independent, so they run concurrently)"""
         logger.info("Starting comprehensive data collection...")
         
-        # Collect news data
+        collectors = (self.collect_news_data, self.collect_sec_data, self.collect_crypto_data)
+        with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+            futures = [executor.submit(collect) for collect in collectors]
+            for future in futures:
+                future.result()
+        
+        logger.info("All data collection completed")
+
+    def collect_news_data(self):
+        """Collect news data"""
+        from regi.news_scraper import RegiNewsScraper
+
         try:
             logger.info("Collecting news data...")
             news_scraper = RegiNewsScraper()
@@ -73,16 +87,23 @@ class FinanceAnalyzer:
             logger.info(f"Collected {len(yahoo_data)} Yahoo Finance articles and {len(reuters_data)} Reuters articles")
         except Exception as e:
             logger.error(f"Error collecting news data: {str(e)}")
-        
-        # Collect SEC data
+
+    def collect_sec_data(self):
+        """Collect SEC data"""
+        from regi.SEC import SEC
+
         try:
             logger.info("Collecting SEC data...")
             sec = SEC()
+            sec.warmup()
             logger.info("SEC data collection completed")
         except Exception as e:
             logger.error(f"Error collecting SEC data: {str(e)}")
-        
-        # Collect crypto data
+
+    def collect_crypto_data(self):
+        """Collect crypto data"""
+        from regi.crypto import Crypto
+
         try:
             logger.info("Collecting cryptocurrency data...")
             crypto = Crypto()
@@ -91,8 +112,6 @@ class FinanceAnalyzer:
             logger.info("Cryptocurrency data collection completed")
         except Exception as e:
             logger.error(f"Error collecting cryptocurrency data: {str(e)}")
-        
-        logger.info("All data collection completed")
 
     def analyze_crypto_trends(self):
         """Analyze cryptocurrency trends and generate insights"""
@@ -106,41 +125,32 @@ class FinanceAnalyzer:
         
         # Sample of top cryptos by market cap
         try:
-            conn = sqlite3.connect(self.db.db_path)
-            top_cryptos_query = """
-                SELECT c.id, c.name, c.symbol, m.price_usd, m.market_cap_usd, m.percent_change_24h
-                FROM cryptocurrency c
-                JOIN crypto_market_data m ON c.id = m.crypto_id
-                WHERE m.timestamp = (
-                    SELECT MAX(timestamp) FROM crypto_market_data
-                )
-                ORDER BY m.market_cap_usd DESC
-                LIMIT 20
-            """
-            top_cryptos = pd.read_sql(top_cryptos_query, conn)
-            conn.close()
+            top_cryptos = self.db.get_top_cryptos(limit=20)
             
             # Store in report data
             self.report_data["crypto_analysis"]["top_cryptos"] = top_cryptos.to_dict(orient='records')
             
-            # Analyze top 10 cryptos
+            # Analyze top 10 cryptos (one batched query for all of them)
             bull_bear_signals = {}
-            for _, crypto in top_cryptos.head(10).iterrows():
-                crypto_id = crypto['id']
-                signal = self.db.analyze_crypto_bull_bear(crypto_id=str(crypto_id))
-                bull_bear_signals[crypto['symbol']] = signal
+            top_10_ids = top_cryptos['id'].head(10).astype(str).tolist()
+            top_10_symbols = top_cryptos['symbol'].head(10).tolist()
+            signals = self.db.analyze_crypto_bull_bear_batch(top_10_ids)
+            for symbol, crypto_id in zip(top_10_symbols, top_10_ids):
+                bull_bear_signals[symbol] = signals[crypto_id]
             
             self.report_data["crypto_analysis"]["signals"] = bull_bear_signals
             logger.info(f"Analyzed trends for top 10 cryptocurrencies")
             
             # Get volatility metrics
             volatility_data = {}
-            for _, crypto in top_cryptos.head(5).iterrows():
-                crypto_id = crypto['id']
-                indicators_df = self.db.calculate_technical_indicators(crypto_id=str(crypto_id))
+            top_5_ids = top_10_ids[:5]
+            top_5_symbols = top_10_symbols[:5]
+            indicators = self.db.calculate_technical_indicators_batch(top_5_ids)
+            for symbol, crypto_id in zip(top_5_symbols, top_5_ids):
+                indicators_df = indicators[crypto_id]
                 if not indicators_df.empty and 'std_7d' in indicators_df.columns:
                     latest = indicators_df.iloc[-1]
-                    volatility_data[crypto['symbol']] = {
+                    volatility_data[symbol] = {
                         "std_7d": float(latest['std_7d']) if not pd.isna(latest['std_7d']) else None,
                         "rsi": float(latest['RSI']) if not pd.isna(latest['RSI']) else None,
                         "price": float(latest['price_usd']) if 'price_usd' in indicators_df.columns else None
@@ -156,45 +166,56 @@ class FinanceAnalyzer:
         logger.info("Analyzing news data...")
         
         try:
-            # Find the most recent news files
-            news_files = [f for f in os.listdir('data') if f.startswith('yfinance_') or f.startswith('reuters_')]
+            # Find the most recent news files in one directory pass; entry.stat() is still one stat() call
+            # per matching file on Linux/POSIX (only Windows returns it with the listing)
+            with os.scandir('data') as entries:
+                news_files = [
+                    (entry.stat().st_ctime, entry.name)
+                    for entry in entries
+                    if entry.name.startswith(('yfinance_', 'reuters_'))
+                ]
             if not news_files:
                 logger.warning("No news data files found")
                 return
             
             # Sort by creation time and get the newest
-            news_files.sort(key=lambda x: os.path.getctime(os.path.join('data', x)), reverse=True)
+            news_files.sort(reverse=True)
             
             # Get the newest Yahoo Finance and Reuters files
-            yfinance_file = next((f for f in news_files if f.startswith('yfinance_')), None)
-            reuters_file = next((f for f in news_files if f.startswith('reuters_')), None)
+            yfinance_file = next((f for _, f in news_files if f.startswith('yfinance_')), None)
+            reuters_file = next((f for _, f in news_files if f.startswith('reuters_')), None)
             
             news_data = []
             
+            # Read both files in parallel
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                if yfinance_file:
+                    yahoo_future = executor.submit(load_json, os.path.join('data', yfinance_file))
+                if reuters_file:
+                    reuters_future = executor.submit(load_json, os.path.join('data', reuters_file))
+            
             # Process Yahoo Finance data
             if yfinance_file:
-                with open(os.path.join('data', yfinance_file), 'r') as f:
-                    yahoo_data = json.load(f)
-                    for article in yahoo_data:
-                        news_data.append({
-                            "source": "Yahoo Finance",
-                            "title": article.get("title", ""),
-                            "date": article.get("published", ""),
-                            "link": article.get("link", "")
-                        })
+                yahoo_data = yahoo_future.result()
+                for article in yahoo_data:
+                    news_data.append({
+                        "source": "Yahoo Finance",
+                        "title": article.get("title", ""),
+                        "date": article.get("published", ""),
+                        "link": article.get("link", "")
+                    })
             
             # Process Reuters data
             if reuters_file:
-                with open(os.path.join('data', reuters_file), 'r') as f:
-                    reuters_data = json.load(f)
-                    for article in reuters_data:
-                        news_data.append({
-                            "source": "Reuters",
-                            "title": article.get("headline", ""),
-                            "date": article.get("publication_datetime", ""),
-                            "link": article.get("url", ""),
-                            "category": article.get("category", "")
-                        })
+                reuters_data = reuters_future.result()
+                for article in reuters_data:
+                    news_data.append({
+                        "source": "Reuters",
+                        "title": article.get("headline", ""),
+                        "date": article.get("publication_datetime", ""),
+                        "link": article.get("url", ""),
+                        "category": article.get("category", "")
+                    })
             
             # Simple category analysis for Reuters articles
             if reuters_file:
@@ -217,18 +238,19 @@ class FinanceAnalyzer:
         """Generate a comprehensive analysis report"""
         logger.info("Generating analysis report...")
         
-        report_path = os.path.join('reports', f'finance_analysis_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
+        now = datetime.datetime.now()
+        report_path = os.path.join('reports', f'finance_analysis_{now.strftime(TS_FMT)}.json')
         
         # Add summary information
         self.report_data["summary"] = {
-            "report_generated": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "report_generated": now.strftime("%Y-%m-%d %H:%M:%S"),
             "crypto_analyzed": len(self.report_data["crypto_analysis"].get("signals", {})),
             "news_analyzed": len(self.report_data["news_analysis"].get("recent_articles", [])),
         }
         
         # Save the report
-        with open(report_path, 'w') as f:
-            json.dump(self.report_data, f, indent=2)
+        with open(report_path, 'wb') as f:
+            f.write(json_dumps(self.report_data, indent=True))
         
         logger.info(f"Analysis report saved to {report_path}")
         return report_path
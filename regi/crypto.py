@@ -1,27 +1,62 @@
 import os
 import sys
-import json
 import datetime
 import logging
-import logging.config
 import asyncio
+import functools
+import pickle
+import time
 
-# Use ccxt Pro (which you must install separately with `pip install ccxtpro`)
-import ccxt # type: ignore
-
-# Add modules from base repo
+# Add modules from base repo (only needed when this file is run as a script, not imported from regi)
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
 
 from regi.session import RequestSession
 from regi.omnidb import OmniDB 
+from regi.utils import configure_logging, json_loads
+
+PAGE_SIZE = 500  # Listings rows requested per page; pages are fetched concurrently
+LISTINGS_TTL = 60  # Seconds a cached listings pull is reused (CMC refreshes listings about once a minute)
+
+def load_cached_listings(cpath: str, ttl: float):
+    """
+    Load a previous fetch_crypto_data result if it was written less than `ttl` seconds ago.
+
+    :param cpath: Path of the pickle cache
+    :param ttl: Maximum age of the cache in seconds
+    :return: The cached (cryptos, market_data, metadata) tuple, or None if missing/stale
+    """
+    try:
+        if time.time() - os.stat(cpath).st_mtime > ttl:
+            return None
+        with open(cpath, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+def save_cached_listings(cpath: str, listings: tuple) -> None:
+    """
+    Write a fetch_crypto_data result to the pickle cache (atomically, so readers never see a partial file).
 
-def get_logging_config() -> dict:
-    jpath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config/loggingConfig.json")
-    config_dict = None
-    with open(jpath, 'r') as f:
-        config_dict = json.load(f)
-    return config_dict
+    :param cpath: Path of the pickle cache
+    :param listings: The (cryptos, market_data, metadata) tuple
+    """
+    tmp_path = f"{cpath}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(listings, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cpath)
+
+@functools.lru_cache(maxsize=None)
+def get_request_session(headers: tuple) -> RequestSession:
+    """
+    Build the RequestSession used for CoinMarketCap requests. It is created once per set of headers,
+    so every Crypto instance reuses the same keep-alive connections to the API.
+
+    :param headers: The request headers as a tuple of (name, value) pairs (hashable for the cache)
+    :return: The shared RequestSession
+    """
+    return RequestSession(headers=dict(headers))
 
 class Crypto:
     def __init__(self):
@@ -36,46 +71,87 @@ class Crypto:
         self.latest_list_url = 'https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest'
         self.latest_list_params = {
             'start': '1',
-            'limit': '5000',
+            'limit': '100',  # CMC's default when no limit is sent, the scope of the pull before these params were passed
             'convert': 'USD'
         }
+        self.cache_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data/cmc_listings.pkl")
 
-        # Configure the logger
-        logconfig = get_logging_config()
-        logging.config.dictConfig(logconfig)
+        # Configure the logger (once per process)
+        configure_logging()
         self.logger = logging.getLogger(__name__)
         self.logger.info("Logging has been configured using the JSON file.")
         
         # Custom library init
-        self.reqsesh = RequestSession(headers=self.headers)
+        self.reqsesh = get_request_session(tuple(self.headers.items()))
         self.db = OmniDB()
 
     def insert_data_into_db(self, cryptos=None, market_data=None, metadata=None):
         """
         Simple wrapper to send data to OmniDB (cryptos, market_data, metadata).
+        All three tables are written in one transaction.
         """
-        if cryptos:
-            self.db.insert_cryptos(cryptos)
-        if market_data:
-            self.db.insert_market_data(market_data)
-        if metadata:
-            self.db.insert_metadata(metadata)
+        self.db.insert_crypto_snapshot(cryptos, market_data, metadata)
+
+    def fetch_listings_page(self, start: int, limit: int) -> list:
+        """
+        Fetch one page of CoinMarketCap's latest listings.
+
+        :param start: 1-based rank of the first coin on the page
+        :param limit: Number of coins on the page
+        :return: The list of coin dicts from the page
+        :raises RuntimeError: If the page could not be fetched (a missing rank range must not pass for a full pull)
+        """
+        params = {**self.latest_list_params, 'start': str(start), 'limit': str(limit)}
+        response = self.reqsesh.get(self.latest_list_url, params=params)  # Byte response
+        if response is None:
+            self.logger.error(f"Listings page starting at {start} could not be fetched.")
+            raise RuntimeError(f"Listings page starting at {start} could not be fetched")
+
+        data = json_loads(response.content)
+        return data.get("data", [])
+
+    async def fetch_listings(self, total: int, page_size: int = PAGE_SIZE) -> list:
+        """
+        Fetch the top `total` listings as concurrent pages and return the coins in rank order.
+
+        :param total: Number of coins to fetch
+        :param page_size: Number of coins per request
+        :return: The concatenated list of coin dicts
+        :raises RuntimeError: If any page could not be fetched
+        """
+        pages = await asyncio.gather(*(
+            asyncio.to_thread(self.fetch_listings_page, start, min(page_size, total - start + 1))
+            for start in range(1, total + 1, page_size)
+        ))
+        return [coin for page in pages for coin in page]
 
     def fetch_crypto_data(self) -> tuple:
         """
         Example method that hits CoinMarketCap's REST API for the latest listings.
         Returns a tuple of (cryptos, market_data, metadata).
+        A pull from the last LISTINGS_TTL seconds is served from disk instead of hitting the API again.
+        Raises RuntimeError (and caches nothing) if any listings page could not be fetched.
         """
-        response = self.reqsesh.get(self.latest_list_url)  # Byte response
-        data = json.loads(response.content)
+        cached = load_cached_listings(self.cache_path, LISTINGS_TTL)
+        if cached is not None:
+            self.logger.info(f"{len(cached[0])} cryptocurrencies loaded from the listings cache.")
+            return cached
+
+        coins = asyncio.run(self.fetch_listings(int(self.latest_list_params['limit'])))
 
         cryptos = []
         market_data = []
         metadata = []
         
         timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+        # Bind the appends once, the loop below runs for every listed coin
+        cryptos_append = cryptos.append
+        market_append = market_data.append
+        metadata_append = metadata.append
+        categories = {}  # Many coins share a tag list, so join each distinct one only once
         
-        for coin in data.get("data", []):
+        for coin in coins:
             crypto_id = coin["id"]
             symbol = coin["symbol"]
             name = coin["name"]
@@ -84,10 +160,10 @@ class Crypto:
             last_updated = coin["last_updated"]
             status = "active"  # or custom logic
 
-            cryptos.append((crypto_id, symbol, name, slug, first_historical, last_updated, status))
+            cryptos_append((crypto_id, symbol, name, slug, first_historical, last_updated, status))
             
             quote = coin["quote"]["USD"]
-            market_data.append((
+            market_append((
                 crypto_id,
                 timestamp,
                 quote["price"],
@@ -101,11 +177,18 @@ class Crypto:
                 coin["max_supply"]
             ))
 
-         # Use coin["tags"] as categories for metadata
-            category = ", ".join(coin.get("tags", []))
-            metadata.append((crypto_id, None, None, None, None, category))
+         # Use coin["tags"] as categories for metadata (missing or null tags join to "")
+            tags = tuple(coin.get("tags") or ())
+            category = categories.get(tags)
+            if category is None:
+                category = categories[tags] = ", ".join(tags)
+            metadata_append((crypto_id, None, None, None, None, category))
 
         self.logger.info(f"{len(cryptos)} cryptocurrencies extracted from the REST API.")
+        # Only a complete pull is cached: fetch_listings raises before we get here if any page failed,
+        # so a partial snapshot is never reused for the whole TTL
+        if cryptos:
+            save_cached_listings(self.cache_path, (cryptos, market_data, metadata))
         return cryptos, market_data, metadata
 
 
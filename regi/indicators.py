@@ -0,0 +1,123 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Indicators fall back to strided NumPy windows when numba isn't installed
+    njit = None
+
+MA_WINDOW = 7
+RSI_WINDOW = 14
+RSI_FLAT = 50.0  # RSI of a window with no gains and no losses (RS is 0/0)
+RSI_OVERBOUGHT = 70.0
+RSI_OVERSOLD = 30.0
+# Signal codes produced by compute_indicators index into this: 0 = neutral, 1 = bearish, 2 = bullish
+SIGNAL_LABELS = np.array(['Neutral/No signal', 'Bearish Signal', 'Bullish Signal'], dtype=object)
+
+def compute_indicators_loop(prices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute every indicator for a single price series with plain loops, meant to be compiled by numba.
+    Matches the pandas semantics (pct_change, rolling mean/std): a window with too few rows or a NaN price yields NaN.
+
+    :param prices: A float64 array of prices sorted by timestamp.
+    :return: A tuple of (daily_return, ma_7d, std_7d, RSI) float64 arrays and int8 signal codes
+             (see SIGNAL_LABELS), aligned with prices.
+    """
+    n = prices.shape[0]
+    ret = np.full(n, np.nan)
+    sma = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    codes = np.zeros(n, dtype=np.int8)  # Rows without an RSI yet stay neutral
+
+    # Daily return (percentage) and the gains/losses the RSI averages (a NaN delta counts as 0, like delta.where)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        ret[i] = (prices[i] / prices[i - 1] - 1) * 100
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    # 7-day mean and sample standard deviation (ddof=1)
+    for i in range(MA_WINDOW - 1, n):
+        total = 0.0
+        for j in range(i - MA_WINDOW + 1, i + 1):
+            total += prices[j]
+        mean = total / MA_WINDOW
+        sq = 0.0
+        for j in range(i - MA_WINDOW + 1, i + 1):
+            sq += (prices[j] - mean) ** 2
+        sma[i] = mean
+        std[i] = np.sqrt(sq / (MA_WINDOW - 1))
+
+    # 14-day RSI on simple rolling means of gains/losses
+    for i in range(RSI_WINDOW - 1, n):
+        gain = 0.0
+        loss = 0.0
+        for j in range(i - RSI_WINDOW + 1, i + 1):
+            gain += gains[j]
+            loss += losses[j]
+        gain /= RSI_WINDOW
+        loss /= RSI_WINDOW
+        # A window without losses is all gains (RSI 100); without either it is flat
+        if loss > 0:
+            rsi[i] = 100 - (100 / (1 + gain / loss))
+        elif gain > 0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = RSI_FLAT
+        if rsi[i] > RSI_OVERBOUGHT:
+            codes[i] = 1
+        elif rsi[i] < RSI_OVERSOLD:
+            codes[i] = 2
+
+    return ret, sma, std, rsi, codes
+
+def compute_indicators_numpy(prices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of compute_indicators_loop for when numba isn't installed.
+    Works on strided window views of one contiguous array, so no pandas Series are built per step.
+
+    :param prices: A float64 array of prices sorted by timestamp.
+    :return: A tuple of (daily_return, ma_7d, std_7d, RSI) float64 arrays and int8 signal codes
+             (see SIGNAL_LABELS), aligned with prices.
+    """
+    n = prices.shape[0]
+    ret = np.full(n, np.nan)
+    sma = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+
+    if n >= 2:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ret[1:] = (prices[1:] / prices[:-1] - 1) * 100
+
+    if n >= MA_WINDOW:
+        windows = np.lib.stride_tricks.sliding_window_view(prices, MA_WINDOW)
+        sma[MA_WINDOW - 1:] = windows.mean(axis=1)
+        std[MA_WINDOW - 1:] = windows.std(axis=1, ddof=1)
+
+    if n >= RSI_WINDOW:
+        delta = np.zeros(n)
+        delta[1:] = np.diff(prices)
+        # NaN compares False on both sides, so a NaN delta counts as 0 like delta.where
+        gains = np.where(delta > 0, delta, 0.0)
+        losses = np.where(delta < 0, -delta, 0.0)
+        gain = np.lib.stride_tricks.sliding_window_view(gains, RSI_WINDOW).mean(axis=1)
+        loss = np.lib.stride_tricks.sliding_window_view(losses, RSI_WINDOW).mean(axis=1)
+        # RS is inf where there are no losses (RSI 100); windows without gains or losses are flat
+        rs = np.divide(gain, loss, out=np.full_like(gain, np.inf), where=loss > 0)
+        rsi[RSI_WINDOW - 1:] = np.where((gain == 0) & (loss == 0), RSI_FLAT, 100 - (100 / (1 + rs)))
+
+    # A NaN RSI compares False on both sides and stays neutral
+    codes = (rsi > RSI_OVERBOUGHT).astype(np.int8) + (rsi < RSI_OVERSOLD).astype(np.int8) * 2
+
+    return ret, sma, std, rsi, codes
+
+# error_model='numpy' lets a zero price divide to inf/NaN like pandas instead of raising ZeroDivisionError
+if njit is not None:
+    compute_indicators = njit(cache=True, error_model='numpy')(compute_indicators_loop)
+else:
+    compute_indicators = compute_indicators_numpy
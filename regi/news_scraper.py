@@ -1,35 +1,37 @@
-import feedparser
 import datetime
-import json
-from pathlib import Path
 import os, sys
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent, FakeUserAgent
-from urllib.parse import urljoin
+import threading
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from requests.exceptions import RequestException
 import logging
-import logging.config
 
-# Add modules from base repo
+# Add modules from base repo (only needed when this file is run as a script, not imported from regi)
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
 
 from regi.session import RequestSession
 from regi.omnidb import OmniDB
+from regi.utils import TS_FMT, configure_logging, json_dumps, json_loads
 
+MAX_SUMMARY_WORKERS = 8  # Article pages fetched concurrently when summarizing a Reuters listing
+SUMMARY_CACHE_SIZE = 2048  # Article summaries remembered per process (least recently used evicted first)
 
-"""
-    STANDALONE METHODS
-"""
+try:
+    from lxml import etree
+except ImportError:  # Fall back to feedparser for the RSS feed when lxml isn't installed
+    etree = None
 
-def get_logging_config() -> dict:
-    jpath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config/loggingConfig.json")
-    config_dict = None
-    with open(jpath, 'r') as f:
-        config_dict = json.load(f)
+# BeautifulSoup tree builder: lxml's C parser when available, else the pure-Python stdlib one
+HTML_PARSER = "lxml" if etree is not None else "html.parser"
 
-    return config_dict
 
+"""
+    STANDALONE METHODS
+"""
 
 def save_json(spath: str, data: Dict, logger) -> None:
     """
@@ -39,8 +41,8 @@ def save_json(spath: str, data: Dict, logger) -> None:
     :param data: The json data to store into a file
     """
     logger.info(f"Saving data in {spath}...")
-    with open(spath, 'w+') as f:
-        json.dump(data, f)
+    with open(spath, 'wb') as f:
+        f.write(json_dumps(data))
 
     
 def request_to_reuters(session: RequestSession) -> bytes:
@@ -52,31 +54,88 @@ def request_to_reuters(session: RequestSession) -> bytes:
     
     return session.get(url)
 
-def fetch_yahoo_finance_rss(logger) -> list:
+def fetch_yahoo_finance_rss(session, logger) -> list:
     """
         Pull all of the feeds from Yahoo Finance RSS
+
+    :param session: The requests session to fetch the feed with (reuses its keep-alive connections)
+    :param logger: The logger to report the article count to
+    :return: A tuple of (articles, date of the last article)
     """
     url = "https://finance.yahoo.com/news/rss"
-    feed = feedparser.parse(url)
+    try:
+        response = session.get(url, timeout=10)
+    except RequestException as e:
+        logger.info(f"Failed to fetch the Yahoo Finance RSS feed: {e}")
+        return [], None
+    if response.status_code != 200:
+        logger.info(f"Failed to fetch the Yahoo Finance RSS feed, status code: {response.status_code}")
+        return [], None
+
     articles = []
     date = None
-    for entry in feed.entries:
+    if etree is not None:
+     # libxml2 parses the feed in C; recover=True tolerates the odd malformed entity like feedparser does.
+     # An empty body raises and a non-XML one recovers to no root; feedparser yielded no entries for both
+        try:
+            root = etree.fromstring(response.content, parser=etree.XMLParser(recover=True))
+        except etree.XMLSyntaxError as e:
+            logger.info(f"Failed to parse the Yahoo Finance RSS feed: {e}")
+            return [], None
+        if root is None:
+            logger.info("The Yahoo Finance RSS feed had no parsable XML, no articles returned")
+            return [], None
+        entries = ((item.findtext("title"), item.findtext("link"), item.findtext("pubDate")) for item in root.iterfind(".//item"))
+    else:
+        import feedparser
+        feed = feedparser.parse(response.content)
+        entries = ((entry.title, entry.link, entry.published) for entry in feed.entries)
+
+    for title, link, published in entries:
         articles.append({
-            "title": entry.title,
-            "title_detail": entry.title_detail,
-            "link": entry.link,
-            "published": entry.published,
+            "title": title,
+            "link": link,
+            "published": published,
         })
-        date = entry.published
+        date = published
     
     logger.info(f"There are {len(articles)} articles in the Yahoo Finance RSS feed")
 
     return articles, date
 
+# Article URL -> summary, shared by every scraper in the process
+# Only pays off in a long-lived process that scrapes repeatedly (stories stay on the Reuters page between scrapes);
+# the src/main.py and analyze.py entrypoints scrape once per process, so there every lookup misses
+summary_cache = OrderedDict()
+summary_cache_lock = threading.Lock()
+
+def get_cached_summary(url: str):
+    """
+        Look up a cached article summary, marking it as the most recently used
+
+    :param url: The article URL
+    :return: The cached summary, or None if the URL isn't cached
+    """
+    with summary_cache_lock:
+        summary = summary_cache.get(url)
+        if summary is not None:
+            summary_cache.move_to_end(url)
+        return summary
+
+def cache_summary(url: str, summary: str) -> None:
+    """
+        Remember an article summary, evicting the least recently used entry once SUMMARY_CACHE_SIZE is exceeded
+    """
+    with summary_cache_lock:
+        summary_cache[url] = summary
+        summary_cache.move_to_end(url)
+        while len(summary_cache) > SUMMARY_CACHE_SIZE:
+            summary_cache.popitem(last=False)
+
 def pull_json(jpath: str) -> dict:
  # Open the path to the JSON file as a fp, and then return the data as a dict
-    with open(jpath, 'r') as f:
-        return json.load(f)
+    with open(jpath, 'rb') as f:
+        return json_loads(f.read())
 
 """
     ANALYTICS ABSTRACTION
@@ -92,9 +151,8 @@ class RegiNewsScraper():
         self.data_dir = os.path.join(self.base_dir, "data")
         self.db = OmniDB()
 
-     # Configure the logger
-        logconfig = get_logging_config()
-        logging.config.dictConfig(logconfig)
+     # Configure the logger (once per process)
+        configure_logging()
         
      # Instantiate the logger
         self.logger = logging.getLogger(__name__)
@@ -111,19 +169,22 @@ class RegiNewsScraper():
         self.reuters_soup = None
      # If the data was successfully retrieved, then open up the soup
         if reuters_data:
-            self.reuters_soup = BeautifulSoup(reuters_data.content, features="html.parser")
+            # Only the <main> element is used, so skip building tags for the rest of the page
+            self.reuters_soup = BeautifulSoup(reuters_data.content, features=HTML_PARSER, parse_only=SoupStrainer("main"))
         # Analyze the Reuters data
             reuters_data, rdate = self.analyze_reuters_data()
         else:
             self.logger.info(f"No data returned from Reuters...")
      
      # Analyze Yahoo Finance data
-        yfinance_data, yfdate = fetch_yahoo_finance_rss(logger=self.logger)
+        yfinance_data, yfdate = fetch_yahoo_finance_rss(session=self.session, logger=self.logger)
         print("\nDate check!!!")
         print(rdate, yfdate)
 
-        spath_yfinance = os.path.join(self.data_dir, f"yfinance_{datetime.datetime.now().strftime('%Y%m%d')}_{datetime.datetime.now().strftime('%H%M%S')}.json")
-        spath_reuters = os.path.join(self.data_dir, f"reuters_{datetime.datetime.now().strftime('%Y%m%d')}_{datetime.datetime.now().strftime('%H%M%S')}.json")
+     # One timestamp for both dumps, so the pair from a single scrape always shares a name suffix
+        stamp = datetime.datetime.now().strftime(TS_FMT)
+        spath_yfinance = os.path.join(self.data_dir, f"yfinance_{stamp}.json")
+        spath_reuters = os.path.join(self.data_dir, f"reuters_{stamp}.json")
 
         if yfinance_data:
             save_json(spath=spath_yfinance, data=yfinance_data, logger=self.logger)
@@ -159,15 +220,24 @@ class RegiNewsScraper():
      # Iterate over each article element and extract details
         date = None
         for article in article_elements:
-            article_data = self.analyze_article(article)
+            article_data = self.analyze_article(article, fetch_summary=False)
             articles.append(article_data)
             date = article_data["publication_datetime"]
 
+     # Fetch the article summaries concurrently, each one is an independent page request
+        with ThreadPoolExecutor(max_workers=MAX_SUMMARY_WORKERS) as executor:
+            summaries = executor.map(
+                lambda article_data: self.fetch_article_summary(article_data["url"]) if article_data["url"] else None,
+                articles
+            )
+            for article_data, summary in zip(articles, summaries):
+                article_data["description"] = summary
+
         self.logger.info(f"There are {len(articles)} in the Reuter's business page")
         return articles, date
 
 
-    def analyze_article(self, article) -> Dict:
+    def analyze_article(self, article, fetch_summary: bool = True) -> Dict:
         """
             Take each MediaStoryCard div and then extract pertinent information from it.
 
@@ -175,36 +245,53 @@ class RegiNewsScraper():
                 [heading, url, category, publication_date, description, image_url, image_alt]
 
         :param article: The HTML of the MediaStoryCard div which pertains to a single article
+        :param fetch_summary: Whether to request the article page for its description here (callers that
+                              batch the summary requests pass False and fill in "description" themselves)
         :return: A dictionary containing all of the extracted information. 
         """
 
         base_url = "https://www.reuters.com"
 
+     # Walk the card once, keeping the first element that matches each target (document order, like find())
+        img_tag = url_tag = heading_tag = link_tag = time_tag = None
+        for el in article.descendants:
+            if not isinstance(el, Tag):
+                continue
+            if img_tag is None and el.name == "img":
+                img_tag = el
+            elif time_tag is None and el.name == "time":
+                time_tag = el
+            if url_tag is None and el.get("aria-hidden") == "true":
+                url_tag = el
+            testid = el.get("data-testid")
+            if heading_tag is None and testid == "Heading":
+                heading_tag = el
+            elif link_tag is None and testid == "Link":
+                link_tag = el
+            if all(tag is not None for tag in (img_tag, url_tag, heading_tag, link_tag, time_tag)):
+                break
+
      # 1. Extract image details:
-     #    Look for the first <img> tag to get the image URL and alt text.
+     #    Use the first <img> tag to get the image URL and alt text.
         image_url = None
         image_alt = None
-        img_tag = article.find("img")
-        if img_tag:
+        if img_tag is not None:
             image_url = img_tag.get("src")
             image_alt = img_tag.get("alt")
 
      # 2. Extract URL:
      #    The headline is contained within one of the heading tags.
-        a_tags = article.find_all(attrs={"aria-hidden": "true"})
-        url_tag = a_tags[0]
-        url = url_tag.get("href")
+        url = url_tag.get("href") if url_tag is not None else None
     
      # Grab the heading for the article
-        heading_element = article.find_all(attrs={"data-testid": "Heading"})
-        if heading_element:
-            heading = heading_element[0].get_text(strip=True)
+        heading = None
+        if heading_tag is not None:
+            heading = heading_tag.get_text(strip=True)
 
      # Grab the link from the article
-        link_element = article.find_all(attrs={"data-testid": "Link"})
         category = None
-        if link_element:
-            category_dirty = link_element[0].get_text(strip=True)
+        if link_tag is not None:
+            category_dirty = link_tag.get_text(strip=True)
             if category_dirty.endswith("category"):
                 category = category_dirty[:-len("category")]
                 if len(category) == 0:
@@ -213,8 +300,7 @@ class RegiNewsScraper():
      # 3. Extract publication datetime:
      #    The <time> element holds the datetime attribute.
         publication_datetime = None
-        time_tag = article.find("time")
-        if time_tag and time_tag.has_attr("datetime"):
+        if time_tag is not None and time_tag.has_attr("datetime"):
             publication_datetime = time_tag["datetime"]
         
         #print((heading, category, publication_datetime, image_url, image_alt), "\n")
@@ -224,7 +310,8 @@ class RegiNewsScraper():
         article_summary = None
         if url:
             article_url = base_url + url
-            article_summary = self.fetch_article_summary(article_url)
+            if fetch_summary:
+                article_summary = self.fetch_article_summary(article_url)
 
         article_data = {
             "headline": heading,
@@ -243,10 +330,16 @@ class RegiNewsScraper():
                 Given an article URL, make a request to the article page and extract a rough summary.
                 This implementation first attempts to extract the content of a meta description, and if not found,
                 it falls back to the first paragraph text.
+                Non-empty summaries are cached by URL, so in a long-lived process a story seen in an earlier scrape
+                isn't requested again.
 
             :param url: The url to the article which you are attempting to scrape from
             :return: A string containing a summary of the article
             """
+            summary = get_cached_summary(url)
+            if summary is not None:
+                return summary
+
             try:
                 response = self.reqsesh.get(url)
                 if not response:
@@ -255,19 +348,22 @@ class RegiNewsScraper():
                 print(f"Error fetching article {url}: {e}")
                 return ""
 
-            article_soup = BeautifulSoup(response.content, "html.parser")
+            article_soup = BeautifulSoup(response.content, HTML_PARSER)
 
+            summary = ""
             # Attempt 1: Look for a meta description
             meta_desc = article_soup.find("meta", attrs={"name": "description"})
             if meta_desc and meta_desc.get("content"):
-                return meta_desc.get("content").strip()
-
-            # Attempt 2: Fallback to the first paragraph text
-            first_paragraph = article_soup.find("p")
-            if first_paragraph:
-                return first_paragraph.get_text(strip=True)
-
-            return ""
+                summary = meta_desc.get("content").strip()
+            else:
+                # Attempt 2: Fallback to the first paragraph text
+                first_paragraph = article_soup.find("p")
+                if first_paragraph:
+                    summary = first_paragraph.get_text(strip=True)
+
+            if summary:
+                cache_summary(url, summary)
+            return summary
     
 if __name__=="__main__":
     reginews = RegiNewsScraper()
@@ -1,25 +1,95 @@
 import sqlite3
 import os
-import datetime
 from contextlib import contextmanager
 import logging
-import json
-import logging.config
 import pandas as pd 
 import numpy as np
 import time
 import random
+import itertools
+import threading
 
-def get_logging_config() -> dict:
+from regi.indicators import compute_indicators, SIGNAL_LABELS
+from regi.utils import configure_logging
+
+SQLITE_DEFAULT_MAX_VARIABLES = 999  # SQLITE_MAX_VARIABLE_NUMBER before 3.32, the floor for any build
+BULK_ROWS_PER_STMT = 200  # Larger VALUES lists measured slower again (one huge statement per chunk)
+FETCH_BATCH_ROWS = 10000
+# Column dtypes for cryptocurrency reads; every other column is text (fetched with object dtype)
+CRYPTOCURRENCY_DTYPES = {'id': np.int64}
+# Column dtypes for crypto_market_data reads; every other column is a REAL
+MARKET_DATA_DTYPES = {'id': np.int64, 'crypto_id': np.int64, 'timestamp': object}
+
+def max_sql_variables(conn) -> int:
+    """
+    Read how many bound parameters one statement may use on this connection (32766 since SQLite 3.32, 999 before,
+    or whatever the build set).
+
+    :param conn: An open sqlite3 connection.
+    :return: The connection's SQLITE_LIMIT_VARIABLE_NUMBER, or SQLITE_DEFAULT_MAX_VARIABLES if it can't be read.
+    """
+    try:
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:  # Connection.getlimit only exists on Python 3.11+
+        return SQLITE_DEFAULT_MAX_VARIABLES
+
+class OmniConnection(sqlite3.Connection):
     """
-    Retrieve the logging configuration from a JSON file.
+    sqlite3 connection that reads its bound-parameter limit once when opened, for bulk_insert to size its chunks.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_variables = max_sql_variables(self)
 
-    :return: A dictionary that can be used to configure logging for the module.
+def bulk_insert(cursor, head: str, rows, ncols: int, tail: str = "", rows_per_stmt: int = BULK_ROWS_PER_STMT):
+    """
+    Insert rows with multi-row INSERT ... VALUES (...),(...) statements, so SQLite compiles and
+    dispatches one statement per chunk instead of one per row.
+    Leftover rows that don't fill a whole chunk go through the single-row statement.
+
+    :param cursor: An open cursor; the caller owns the transaction.
+    :param head: The statement up to (not including) VALUES, e.g. "INSERT INTO t (a, b)".
+    :param rows: A sequence of row tuples, each with ncols values.
+    :param ncols: Number of bound parameters per row.
+    :param tail: Anything that follows the VALUES list, e.g. an ON CONFLICT clause.
+    :param rows_per_stmt: Rows packed into each statement, capped by the connection's bound-parameter limit.
+    :return: None
+    """
+    max_variables = getattr(cursor.connection, "max_variables", None) or max_sql_variables(cursor.connection)
+    rows_per_stmt = max(1, min(rows_per_stmt, max_variables // ncols))
+    placeholder = "(" + ", ".join(["?"] * ncols) + ")"
+    multi_query = f"{head} VALUES {', '.join([placeholder] * rows_per_stmt)} {tail}"
+    full = len(rows) - len(rows) % rows_per_stmt
+
+    # The same SQL text for every full chunk, so the prepared statement is reused from the cache
+    for start in range(0, full, rows_per_stmt):
+        cursor.execute(multi_query, tuple(itertools.chain.from_iterable(rows[start:start + rows_per_stmt])))
+    if full < len(rows):
+        cursor.executemany(f"{head} VALUES {placeholder} {tail}", rows[full:])
+
+def fetch_frame(cursor, dtypes: dict, default_dtype=np.float64, batch_rows: int = FETCH_BATCH_ROWS) -> pd.DataFrame:
     """
-    jpath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config/loggingConfig.json")
-    with open(jpath, 'r') as f:
-        config_dict = json.load(f)
-    return config_dict
+    Build a DataFrame from an executed query by pulling rows in batches straight into typed NumPy columns,
+    instead of holding the whole result as a list of tuples next to the DataFrame built from it.
+
+    :param cursor: A cursor with an executed SELECT.
+    :param dtypes: Column name -> NumPy dtype; columns not listed use default_dtype (NULLs become NaN for floats).
+    :param default_dtype: The dtype for columns not in dtypes.
+    :param batch_rows: Rows fetched per fetchmany call.
+    :return: A pandas DataFrame with the query's columns, or an empty DataFrame if no rows matched.
+    """
+    columns = [desc[0] for desc in cursor.description]
+    column_dtypes = [dtypes.get(name, default_dtype) for name in columns]
+    chunks = [[] for _ in columns]
+
+    cursor.arraysize = batch_rows
+    for batch in iter(cursor.fetchmany, []):
+        for chunk, dtype, values in zip(chunks, column_dtypes, zip(*batch)):
+            chunk.append(np.array(values, dtype=dtype))
+
+    if not chunks or not chunks[0]:
+        return pd.DataFrame()
+    return pd.DataFrame({name: np.concatenate(chunk) for name, chunk in zip(columns, chunks)})
 
 class OmniDB:
     def __init__(self):
@@ -27,12 +97,55 @@ class OmniDB:
         Initializes the OmniDB class by setting up the database path and configuring logging.
         """
         self.db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data/omni.db")
-        print(self.db_path)
-
-        logconfig = get_logging_config()
-        logging.config.dictConfig(logconfig)
-
+        # Each thread opens its own connection on first use (see get_connection), reused by its sqlite_connect blocks
+        self._local = threading.local()
+        # News source/category name -> id, shared by all threads; only committed ids go in (ids never change after that).
+        # Ids read inside an open transaction wait in the thread's pending dicts (see _pending_news_ids) until it commits
+        self._source_ids = {}
+        self._category_ids = {}
+        self._id_cache_lock = threading.Lock()
+        # Set once crypto_signals is known to exist, so the read/write paths don't repeat the DDL on every call
+        self._signals_table_ready = False
+
+        configure_logging()
         self.logger = logging.getLogger(__name__)
+        self.logger.debug("Using database at %s", self.db_path)
+
+    def get_connection(self, timeout=60) -> sqlite3.Connection:
+        """
+        Return the calling thread's SQLite connection, opening it and applying the connection PRAGMAs on first use.
+        sqlite3 connections can't be shared across threads, so one OmniDB used from several threads
+        keeps one connection per thread (WAL lets their readers run alongside the writer).
+
+        :param timeout: SQLite busy timeout in seconds (only used when the connection is opened)
+        :return: The thread's sqlite3.Connection
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # The connection lives as long as the instance, so give its prepared-statement cache room for every
+            # query shape used here (multi-row inserts and IN (...) lists of each size count as separate shapes)
+            conn = sqlite3.connect(self.db_path, timeout=timeout, cached_statements=256,
+                                   factory=OmniConnection)
+            conn.execute("PRAGMA foreign_keys = ON")
+            # WAL lets a commit append to the log instead of rewriting the rollback journal,
+            # and synchronous=NORMAL only fsyncs at checkpoints (still safe in WAL mode)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            # Keep sort/temp b-trees in RAM, give the page cache 64 MiB and read the file through a 256 MiB mmap
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -65536")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """
+        Close the calling thread's SQLite connection (the next sqlite_connect block reopens it).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     @contextmanager
     def sqlite_connect(self, smesg=None, timeout=60, max_retries=5, retry_delay=1.0):
@@ -40,7 +153,10 @@ class OmniDB:
         Context manager providing a cursor to interact with the SQLite database.
         Automatically commits if successful, and rolls back on errors.
         Implements retry logic for database locks.
+        Cursors come from the instance's long-lived connection (see get_connection), so chained calls
+        don't pay for a new connection and PRAGMA setup each time.
 
+        :param smesg: Optional message logged (at DEBUG) once the block has committed
         :param timeout: SQLite connection timeout in seconds
         :param max_retries: Maximum number of retries in case of database locks
         :param retry_delay: Base delay between retries in seconds (exponential backoff applied)
@@ -51,15 +167,16 @@ class OmniDB:
         
         while retry_count <= max_retries:
             try:
-                conn = sqlite3.connect(self.db_path, timeout=timeout)
-                conn.execute("PRAGMA foreign_keys = ON")
+                conn = self.get_connection(timeout)
                 cursor = conn.cursor()
                 
                 yield cursor
                 
                 # If we get here, operation was successful
                 conn.commit()
-                print(smesg)
+                self._publish_news_ids()
+                if smesg:
+                    self.logger.debug(smesg)
                 return
                 
             except sqlite3.OperationalError as e:
@@ -69,12 +186,12 @@ class OmniDB:
                     delay = retry_delay * (2 ** (retry_count - 1)) * (0.5 + random.random())
                     self.logger.warning(f"Database locked, retrying in {delay:.2f} seconds (attempt {retry_count}/{max_retries})")
                     
-                    # Clean up before retry
+                    # Clean up before retry (the connection itself stays open for reuse)
                     if cursor:
                         cursor.close()
                     if conn:
                         conn.rollback()
-                        conn.close()
+                        self._pending_news_ids().clear()
                     
                     time.sleep(delay)
                 else:
@@ -82,28 +199,66 @@ class OmniDB:
                     self.logger.error(f"SQLite error: {str(e)}")
                     if conn:
                         conn.rollback()
+                        self._pending_news_ids().clear()
                     raise
                     
             except Exception as e:
                 self.logger.error(f"Error during database operation: {str(e)}")
                 if conn:
                     conn.rollback()
+                    self._pending_news_ids().clear()
                 raise
                 
             finally:
-                # This block is executed after the try/except block,
-                # but only if we didn't continue the while loop
-                if retry_count == max_retries:
-                    if cursor:
-                        cursor.close()
-                    if conn:
-                        conn.close()
+                # Always release the cursor: on the long-lived connection an unfinished SELECT would
+                # otherwise keep its read snapshot open into the next block
+                if cursor:
+                    cursor.close()
         
         # If we've exhausted all retries
         if retry_count > max_retries:
             self.logger.error(f"Failed to acquire database lock after {max_retries} retries")
             raise sqlite3.OperationalError(f"Database still locked after {max_retries} retries")
         
+    def _pending_news_ids(self) -> dict:
+        """
+        The calling thread's source/category ids read inside its open transaction, keyed by (table, name).
+        They are only visible to this thread until sqlite_connect commits and publishes them; a rollback drops them,
+        since the rows (and their ids, which AUTOINCREMENT may hand out again) may never exist.
+
+        :return: The thread's dictionary of (table, name) -> id
+        """
+        pending = getattr(self._local, "pending_news_ids", None)
+        if pending is None:
+            pending = self._local.pending_news_ids = {}
+        return pending
+
+    def _publish_news_ids(self):
+        """
+        Move the calling thread's pending source/category ids into the shared caches, once their transaction committed.
+        """
+        pending = self._pending_news_ids()
+        if not pending:
+            return
+        with self._id_cache_lock:
+            for (table, name), news_id in pending.items():
+                (self._source_ids if table == "news_sources" else self._category_ids)[name] = news_id
+        pending.clear()
+
+    def _cached_news_id(self, table: str, name: str):
+        """
+        Look up a source/category id in the shared cache, then in the calling thread's pending ids.
+
+        :param table: 'news_sources' or 'news_categories'
+        :param name: The source or category name
+        :return: The id, or None if it hasn't been read yet
+        """
+        with self._id_cache_lock:
+            news_id = (self._source_ids if table == "news_sources" else self._category_ids).get(name)
+        if news_id is None:
+            news_id = self._pending_news_ids().get((table, name))
+        return news_id
+
     def initialize_database(self):
         """
         Initialize all tables if they don't exist.
@@ -117,6 +272,7 @@ class OmniDB:
             
             with self.sqlite_connect() as cursor:
                 cursor.executescript(sql_script)
+            self._signals_table_ready = True  # omni.sql creates crypto_signals too
             
             self.logger.info("Initialized all tables using SQL script")
 
@@ -128,9 +284,13 @@ class OmniDB:
         """
         Create the 'crypto_signals' table if it does not exist.
         This table will store the technical indicators for each crypto/timestamp pair.
+        Only the first call per instance touches the database.
         
         :return: None
         """
+        if self._signals_table_ready:
+            return
+
         create_table_query = """
         CREATE TABLE IF NOT EXISTS crypto_signals (
             crypto_id TEXT NOT NULL,
@@ -146,47 +306,88 @@ class OmniDB:
         with self.sqlite_connect() as cursor:
             cursor.execute(create_table_query)
             self.logger.info("Ensured that crypto_signals table exists.")
+        self._signals_table_ready = True
 
     ##################
     # CREATE Methods #
     ##################
 
-    def insert_cryptos(self, cryptos):
+    def insert_crypto_snapshot(self, cryptos=None, market_data=None, metadata=None, upsert=True):
+        """
+        Insert a full listings snapshot (cryptos, market data and metadata) in a single transaction,
+        so the whole load costs one commit instead of one per table.
+        Market data and metadata rows for coins that insert_cryptos ignored (CMC symbols and slugs aren't unique,
+        and cryptocurrency.symbol/slug are) are skipped, since their foreign key would fail the whole transaction.
+
+        :param cryptos: Rows for insert_cryptos (optional)
+        :param market_data: Rows for insert_market_data (optional)
+        :param metadata: Rows for insert_metadata (optional)
+        :param upsert: Passed on to insert_market_data and insert_metadata
+        :return: None
+        """
+        with self.sqlite_connect() as cursor:
+            # Take the write lock up front, so a concurrent writer makes us wait on the busy timeout
+            # here instead of failing the upgrade from a read lock halfway through the load
+            cursor.execute("BEGIN IMMEDIATE")
+            if cryptos:
+                self.insert_cryptos(cryptos, cursor=cursor)
+                cursor.execute("SELECT id FROM cryptocurrency")
+                known_ids = {row[0] for row in cursor.fetchall()}
+                skipped = {row[0] for row in cryptos if row[0] not in known_ids}
+                if skipped:
+                    self.logger.warning(f"{len(skipped)} coins were not stored (symbol or slug already taken): {sorted(skipped)}")
+                    market_data = [row for row in market_data or () if row[0] not in skipped]
+                    metadata = [row for row in metadata or () if row[0] not in skipped]
+            if market_data:
+                self.insert_market_data(market_data, cursor=cursor, upsert=upsert)
+            if metadata:
+                self.insert_metadata(metadata, cursor=cursor, upsert=upsert)
+
+    def insert_cryptos(self, cryptos, cursor=None):
         """
         Insert or ignore new cryptocurrencies into the `cryptocurrency` table.
 
         :param cryptos: A list of tuples, where each tuple corresponds to:
                         (id, symbol, name, slug, first_historical_data, last_historical_data, status)
+        :param cursor: An open cursor to run in the caller's transaction (optional)
         :return: None
         """
-        query = """
+        head = """
             INSERT OR IGNORE INTO cryptocurrency (
                 id, symbol, name, slug, first_historical_data, last_historical_data, status
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?);
         """
-        with self.sqlite_connect() as cursor:
-            cursor.executemany(query, cryptos)
-            self.logger.info(f"{len(cryptos)} coins inserted into the cryptocurrency table.")
+        if cursor is None:
+            with self.sqlite_connect() as cursor:
+                cursor.execute("BEGIN IMMEDIATE")  # Same write-lock-first rule as insert_crypto_snapshot
+                return self.insert_cryptos(cryptos, cursor=cursor)
+
+        bulk_insert(cursor, head, cryptos, ncols=7)
+        self.logger.info(f"{len(cryptos)} coins inserted into the cryptocurrency table.")
 
-    def insert_market_data(self, market_data):
+    def insert_market_data(self, market_data, cursor=None, upsert=True):
         """
         Insert or update market data into the `crypto_market_data` table.
-        Uses ON CONFLICT for (crypto_id, timestamp) to update existing records.
+        Uses ON CONFLICT for (crypto_id, timestamp) to update existing records, or skips them when upsert is False.
 
         :param market_data: A list of tuples where each tuple corresponds to:
                             (crypto_id, timestamp, price_usd, market_cap_usd, volume_24h_usd,
                              percent_change_1h, percent_change_24h, percent_change_7d,
                              circulating_supply, total_supply, max_supply)
+        :param cursor: An open cursor to run in the caller's transaction (optional)
+        :param upsert: Update rows that already exist; pass False for append-only history,
+                       which uses INSERT OR IGNORE and skips the update branch entirely
         :return: None
         """
-        query = """
-            INSERT INTO crypto_market_data (
+        verb = "INSERT" if upsert else "INSERT OR IGNORE"
+        head = f"""
+            {verb} INTO crypto_market_data (
                 crypto_id, timestamp, price_usd, market_cap_usd, volume_24h_usd,
                 percent_change_1h, percent_change_24h, percent_change_7d,
                 circulating_supply, total_supply, max_supply
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        tail = """
             ON CONFLICT(crypto_id, timestamp)
             DO UPDATE SET
                 price_usd = excluded.price_usd,
@@ -199,31 +400,47 @@ class OmniDB:
                 total_supply = excluded.total_supply,
                 max_supply = excluded.max_supply;
         """
-        with self.sqlite_connect() as cursor:
-            cursor.executemany(query, market_data)
-            self.logger.info(f"{len(market_data)} data items inserted/updated in the crypto_market_data table.")
+        if not upsert:
+            tail = ""
+        if cursor is None:
+            with self.sqlite_connect() as cursor:
+                cursor.execute("BEGIN IMMEDIATE")  # Same write-lock-first rule as insert_crypto_snapshot
+                return self.insert_market_data(market_data, cursor=cursor, upsert=upsert)
 
-    def insert_metadata(self, metadata):
+        bulk_insert(cursor, head, market_data, ncols=11, tail=tail)
+        self.logger.info(f"{len(market_data)} data items inserted/updated in the crypto_market_data table.")
+
+    def insert_metadata(self, metadata, cursor=None, upsert=True):
         """
         Insert or update cryptocurrency metadata into the `crypto_metadata` table.
-        Uses ON CONFLICT(crypto_id) to update existing records.
+        Uses ON CONFLICT(crypto_id) to update existing records, or skips them when upsert is False.
 
         :param metadata: A list of tuples where each tuple corresponds to:
                          (crypto_id, logo_url, website_url, technical_doc, description, category)
+        :param cursor: An open cursor to run in the caller's transaction (optional)
+        :param upsert: Refresh the category of rows that already exist; pass False when it hasn't changed
         :return: None
         """
-        query = """
-            INSERT INTO crypto_metadata (
+        verb = "INSERT" if upsert else "INSERT OR IGNORE"
+        head = f"""
+            {verb} INTO crypto_metadata (
                 crypto_id, logo_url, website_url, technical_doc, description, category
             )
-            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        tail = """
             ON CONFLICT(crypto_id)
             DO UPDATE SET
                 category = excluded.category;
         """
-        with self.sqlite_connect() as cursor:
-            cursor.executemany(query, metadata)
-            self.logger.info(f"{len(metadata)} metadata items inserted/updated in the crypto_metadata table.")
+        if not upsert:
+            tail = ""
+        if cursor is None:
+            with self.sqlite_connect() as cursor:
+                cursor.execute("BEGIN IMMEDIATE")  # Same write-lock-first rule as insert_crypto_snapshot
+                return self.insert_metadata(metadata, cursor=cursor, upsert=upsert)
+
+        bulk_insert(cursor, head, metadata, ncols=6, tail=tail)
+        self.logger.info(f"{len(metadata)} metadata items inserted/updated in the crypto_metadata table.")
 
     ###############
     # READ Methods#
@@ -238,13 +455,39 @@ class OmniDB:
         query = "SELECT * FROM cryptocurrency;"
         with self.sqlite_connect() as cursor:
             cursor.execute(query)
-            rows = cursor.fetchall()
-            if rows:
-                df = pd.DataFrame(rows, columns=[desc[0] for desc in cursor.description])
+            df = fetch_frame(cursor, CRYPTOCURRENCY_DTYPES, default_dtype=object)
+            if not df.empty:
                 self.logger.info(f"SELECT query on 'cryptocurrency' was successful!")
-                return df
-            else:
-                return pd.DataFrame()  # Return empty DataFrame if no records
+            return df  # Empty DataFrame if no records
+
+    def get_top_cryptos(self, limit: int = 20) -> pd.DataFrame:
+        """
+        Retrieve the largest cryptocurrencies by market cap at the latest market data timestamp.
+
+        :param limit: The number of cryptocurrencies to return.
+        :return: A pandas DataFrame with id, name, symbol, price_usd, market_cap_usd and percent_change_24h.
+        """
+        query = """
+            SELECT c.id, c.name, c.symbol, m.price_usd, m.market_cap_usd, m.percent_change_24h
+            FROM cryptocurrency c
+            JOIN crypto_market_data m ON c.id = m.crypto_id
+            WHERE m.timestamp = (
+                SELECT MAX(timestamp) FROM crypto_market_data
+            )
+            ORDER BY m.market_cap_usd DESC
+            LIMIT ?
+        """
+        # Explicit dtypes skip pandas' per-column type inference
+        dtype = {
+            'id': 'int64',
+            'price_usd': 'float64',
+            'market_cap_usd': 'float64',
+            'percent_change_24h': 'float64'
+        }
+        with self.sqlite_connect() as cursor:
+            df = pd.read_sql_query(query, cursor.connection, params=(limit,), dtype=dtype)
+            self.logger.info(f"SELECT query for the top {limit} cryptos was successful!")
+            return df
 
     def get_market_data(self, crypto_id: str, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         """
@@ -262,15 +505,45 @@ class OmniDB:
             query += " AND timestamp BETWEEN ? AND ?"
             params.extend([start_date, end_date])
 
+        # The UNIQUE(crypto_id, timestamp) index already returns rows in this order, so it costs no sort
+        query += " ORDER BY crypto_id, timestamp"
+
         with self.sqlite_connect() as cursor:
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            if rows:
-                df = pd.DataFrame(rows, columns=[desc[0] for desc in cursor.description])
+            df = fetch_frame(cursor, MARKET_DATA_DTYPES)
+            if not df.empty:
                 self.logger.info(f"SELECT query on 'crypto_market_data' was successful!")
-                return df
-            else:
-                return pd.DataFrame()
+            return df
+
+    def get_market_data_batch(self, crypto_ids: list, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+        """
+        Retrieve market data for several crypto_ids with a single query.
+
+        :param crypto_ids: The IDs of the cryptocurrencies.
+        :param start_date: Start date for the query range (YYYY-MM-DD HH:MM:SS).
+        :param end_date: End date for the query range (YYYY-MM-DD HH:MM:SS).
+        :return: A pandas DataFrame containing the matching market data records for all of the IDs.
+        """
+        if not crypto_ids:
+            return pd.DataFrame()
+
+        placeholders = ", ".join("?" * len(crypto_ids))
+        query = f"SELECT * FROM crypto_market_data WHERE crypto_id IN ({placeholders})"
+        params = list(crypto_ids)
+
+        if start_date and end_date:
+            query += " AND timestamp BETWEEN ? AND ?"
+            params.extend([start_date, end_date])
+
+        # The UNIQUE(crypto_id, timestamp) index already returns rows in this order, so it costs no sort
+        query += " ORDER BY crypto_id, timestamp"
+
+        with self.sqlite_connect() as cursor:
+            cursor.execute(query, params)
+            df = fetch_frame(cursor, MARKET_DATA_DTYPES)
+            if not df.empty:
+                self.logger.info(f"SELECT query on 'crypto_market_data' for {len(crypto_ids)} cryptos was successful!")
+            return df
 
     def get_latest_market_data(self, crypto_id: str) -> pd.DataFrame:
         """
@@ -288,11 +561,39 @@ class OmniDB:
         """
         with self.sqlite_connect() as cursor:
             cursor.execute(query, (crypto_id,))
+            df = fetch_frame(cursor, MARKET_DATA_DTYPES)
+            if not df.empty:
+                self.logger.info(f"SELECT query on 'crypto_market_data' was successful!")
+            return df
+
+    def get_latest_signal(self, crypto_id: str) -> pd.DataFrame:
+        """
+        Retrieve the most recent stored indicator row for a given crypto_id, but only if it is current,
+        i.e. it was computed from the latest market data row for that crypto.
+
+        :param crypto_id: The ID of the cryptocurrency.
+        :return: A pandas DataFrame with a single row (RSI, signal, timestamp) or empty if missing or stale.
+        """
+        # datetime() normalizes the stored timestamp, which drops the time part for midnight rows
+        query = """
+            SELECT s.RSI, s.signal, s.timestamp
+            FROM (
+                SELECT RSI, signal, timestamp
+                FROM crypto_signals
+                WHERE crypto_id = ?
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ) s
+            WHERE datetime(s.timestamp) >= (
+                SELECT MAX(timestamp) FROM crypto_market_data WHERE crypto_id = ?
+            );
+        """
+        self.create_signals_table()
+        with self.sqlite_connect() as cursor:
+            cursor.execute(query, (str(crypto_id), crypto_id))
             row = cursor.fetchone()
             if row:
-                df = pd.DataFrame([row], columns=[desc[0] for desc in cursor.description])
-                self.logger.info(f"SELECT query on 'crypto_market_data' was successful!")
-                return df
+                return pd.DataFrame([row], columns=[desc[0] for desc in cursor.description])
             else:
                 return pd.DataFrame()
 
@@ -385,36 +686,97 @@ class OmniDB:
             self.logger.warning(f"No market data found for {crypto_id} in given date range.")
             return df
 
-        # Convert timestamp column to datetime if needed
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df.sort_values(by='timestamp', inplace=True)
+        return self.add_technical_indicators(df)
+
+    def get_latest_signals(self, crypto_ids: list) -> pd.DataFrame:
+        """
+        Same as get_latest_signal, but for several cryptocurrencies with a single query.
+
+        :param crypto_ids: The IDs of the cryptocurrencies.
+        :return: A pandas DataFrame with one row (crypto_id, RSI, signal, timestamp) per crypto whose newest stored
+                 signal is current; cryptos with a missing or stale signal have no row.
+        """
+        if not crypto_ids:
+            return pd.DataFrame()
+
+        # Pick each crypto's newest signal first, so the staleness check runs once per crypto rather than once per
+        # stored row; every lookup is a (crypto_id, timestamp) index search. crypto_signals.crypto_id is TEXT
+        placeholders = ", ".join("?" * len(crypto_ids))
+        query = f"""
+            SELECT s.crypto_id, s.RSI, s.signal, s.timestamp
+            FROM (
+                SELECT crypto_id, MAX(timestamp) AS timestamp
+                FROM crypto_signals
+                WHERE crypto_id IN ({placeholders})
+                GROUP BY crypto_id
+            ) latest
+            JOIN crypto_signals s ON s.crypto_id = latest.crypto_id AND s.timestamp = latest.timestamp
+            WHERE datetime(s.timestamp) >= (
+                SELECT MAX(timestamp) FROM crypto_market_data WHERE crypto_id = CAST(s.crypto_id AS INTEGER)
+            );
+        """
+        self.create_signals_table()
+        with self.sqlite_connect() as cursor:
+            cursor.execute(query, [str(crypto_id) for crypto_id in crypto_ids])
+            rows = cursor.fetchall()
+            if rows:
+                return pd.DataFrame(rows, columns=[desc[0] for desc in cursor.description])
+            else:
+                return pd.DataFrame()
+
+    def calculate_technical_indicators_batch(self, crypto_ids: list, start_date: str = None, end_date: str = None) -> dict:
+        """
+        Same as calculate_technical_indicators, but for several cryptocurrencies at once.
+        The market data for all of them is pulled with one query and then split per crypto_id.
+
+        :param crypto_ids: The IDs of the cryptocurrencies.
+        :param start_date: Optional start date for the data (YYYY-MM-DD HH:MM:SS).
+        :param end_date: Optional end date for the data (YYYY-MM-DD HH:MM:SS).
+        :return: A dictionary of crypto_id (as a string) -> indicator DataFrame, in the order given.
+                 Cryptos without market data map to an empty DataFrame.
+        """
+        crypto_ids = [str(crypto_id) for crypto_id in crypto_ids]
+        df = self.get_market_data_batch(crypto_ids, start_date, end_date)
+
+        indicators = {}
+        if not df.empty:
+            for crypto_id, group in df.groupby('crypto_id', sort=False):
+                indicators[str(crypto_id)] = self.add_technical_indicators(group.reset_index(drop=True))
 
-        # ---------- Example Metrics: Daily Returns & Rolling Averages ---------- #
-        if 'price_usd' in df.columns:
-            # 1. Daily Return (percentage)
-            df['daily_return'] = df['price_usd'].pct_change() * 100
+        for crypto_id in crypto_ids:
+            if crypto_id not in indicators:
+                self.logger.warning(f"No market data found for {crypto_id} in given date range.")
+                indicators[crypto_id] = pd.DataFrame()
 
-            # 2. 7-Day Moving Average Price
-            df['ma_7d'] = df['price_usd'].rolling(window=7).mean()
+        return {crypto_id: indicators[crypto_id] for crypto_id in crypto_ids}
 
-            # 3. 7-Day Rolling Standard Deviation (volatility proxy)
-            df['std_7d'] = df['price_usd'].rolling(window=7).std()
+    def add_technical_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate the technical indicators for the market data of a single cryptocurrency.
 
-        # ---------- Example RSI Calculation (14-day) ---------- #
-        window_length = 14
-        delta = df['price_usd'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window_length).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window_length).mean()
-        df['RSI'] = 100 - (100 / (1 + (gain / (loss + 1e-9))))
+        :param df: A non-empty pandas DataFrame of crypto_market_data rows for one crypto_id.
+        :return: The same DataFrame, sorted by timestamp, with the indicator and signal columns added.
+        """
+        # Convert timestamp column to datetime if needed
+        # (rows from get_market_data are already ordered, so only sort frames that aren't)
+        if 'timestamp' in df.columns:
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            if not df['timestamp'].is_monotonic_increasing:
+                df.sort_values(by='timestamp', inplace=True)
+
+        # ---------- Example Metrics: Daily Returns, Rolling Averages & RSI ---------- #
+        # Daily return (percentage), 7-Day MA, 7-Day Std (volatility proxy) and 14-Day RSI in one pass over
+        # a contiguous array (compiled kernel when numba is installed, strided NumPy windows otherwise)
+        prices = df['price_usd'].to_numpy(dtype=np.float64, copy=False)
+        daily_return, ma_7d, std_7d, rsi, codes = compute_indicators(prices)
+        df['daily_return'] = daily_return
+        df['ma_7d'] = ma_7d
+        df['std_7d'] = std_7d
+        df['RSI'] = rsi
 
         # ---------- Generate Simple Signal ---------- #
-        conditions = [
-            (df['RSI'] > 70),
-            (df['RSI'] < 30)
-        ]
-        choices = ['Bearish Signal', 'Bullish Signal']
-        df['signal'] = np.select(conditions, choices, default='Neutral/No signal')
+        # The kernel already coded each row: 0 = neutral, 1 = bearish (RSI > 70), 2 = bullish (RSI < 30)
+        df['signal'] = SIGNAL_LABELS[codes]
 
         return df
 
@@ -422,10 +784,16 @@ class OmniDB:
         """
         Insert or replace indicator rows into the 'crypto_signals' table.
         Expects columns: ['crypto_id', 'timestamp', 'daily_return', 'ma_7d', 'std_7d', 'RSI', 'signal'].
+        Rows where any indicator is still NaN (the warm-up of the rolling windows) are skipped.
         
         :param indicators_df: The pandas DataFrame with indicator columns to store.
         :return: None
         """
+        # The first rows of each series are still filling the rolling windows; storing their NaNs
+        # only adds write volume, so keep the rows where every indicator is defined
+        if not indicators_df.empty:
+            indicators_df = indicators_df.dropna(subset=['daily_return', 'ma_7d', 'std_7d', 'RSI'])
+
         if indicators_df.empty:
             self.logger.warning("No indicator data to save.")
             return
@@ -438,8 +806,9 @@ class OmniDB:
             indicators_df['timestamp'] = indicators_df['timestamp'].astype(str)
 
         # Prepare the data for insertion
-        # We only insert columns relevant to the signals table
-        records = indicators_df[[
+        # We only insert columns relevant to the signals table. tolist() hands back native Python
+        # values once per column (a numpy.int64 crypto_id would otherwise be bound as an 8-byte BLOB)
+        records = list(zip(*(indicators_df[column].tolist() for column in (
             'crypto_id',
             'timestamp',
             'daily_return',
@@ -447,9 +816,9 @@ class OmniDB:
             'std_7d',
             'RSI',
             'signal'
-        ]].to_records(index=False)  # Convert df to numpy recarray, then to list of tuples
+        ))))
 
-        insert_query = """
+        insert_head = """
         INSERT OR REPLACE INTO crypto_signals (
             crypto_id, 
             timestamp, 
@@ -459,11 +828,10 @@ class OmniDB:
             RSI, 
             signal
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?);
         """
 
         with self.sqlite_connect() as cursor:
-            cursor.executemany(insert_query, records)
+            bulk_insert(cursor, insert_head, records, ncols=7)
             self.logger.info(f"Saved {len(records)} indicator records to crypto_signals table.")
 
     def analyze_crypto_bull_bear(self, crypto_id: str, start_date: str = None, end_date: str = None) -> str:
@@ -476,6 +844,12 @@ class OmniDB:
         :param end_date: Optional end date for the data (YYYY-MM-DD HH:MM:SS).
         :return: A string indicating "Bullish", "Bearish", or "Neutral".
         """
+        # Without a date range, a stored signal for the latest market data row is already the answer
+        if not (start_date and end_date):
+            latest = self.get_latest_signal(crypto_id)
+            if not latest.empty:
+                return self.describe_signal(crypto_id, latest)
+
         df = self.calculate_technical_indicators(crypto_id, start_date, end_date)
         if df.empty:
             return "No data available to determine a trend."
@@ -483,7 +857,53 @@ class OmniDB:
         # Save the updated DataFrame to db so we can do future queries without recalculating
         self.save_indicators_to_db(df)
 
-        latest_row = df.iloc[-1]
+        return self.describe_signal(crypto_id, df)
+
+    def analyze_crypto_bull_bear_batch(self, crypto_ids: list, start_date: str = None, end_date: str = None) -> dict:
+        """
+        Same as analyze_crypto_bull_bear, but for several cryptocurrencies at once. Current stored signals are read
+        with one query; the market data of the rest is read with one query and their indicators are saved in one write.
+
+        :param crypto_ids: The IDs of the cryptocurrencies to analyze.
+        :param start_date: Optional start date for the data (YYYY-MM-DD HH:MM:SS).
+        :param end_date: Optional end date for the data (YYYY-MM-DD HH:MM:SS).
+        :return: A dictionary of crypto_id (as a string) -> "Bullish", "Bearish", or "Neutral" assessment.
+        """
+        crypto_ids = [str(crypto_id) for crypto_id in crypto_ids]
+        assessments = {}
+
+        # Without a date range, cryptos with a current stored signal need no recompute (see analyze_crypto_bull_bear)
+        if not (start_date and end_date):
+            current = self.get_latest_signals(crypto_ids)
+            if not current.empty:
+                for crypto_id, latest in current.groupby('crypto_id', sort=False):
+                    assessments[crypto_id] = self.describe_signal(crypto_id, latest)
+
+        stale_ids = [crypto_id for crypto_id in crypto_ids if crypto_id not in assessments]
+        if stale_ids:
+            indicators = self.calculate_technical_indicators_batch(stale_ids, start_date, end_date)
+
+            frames = [df for df in indicators.values() if not df.empty]
+            if frames:
+                self.save_indicators_to_db(pd.concat(frames, ignore_index=True))
+
+            for crypto_id, df in indicators.items():
+                assessments[crypto_id] = self.describe_signal(crypto_id, df)
+
+        return {crypto_id: assessments[crypto_id] for crypto_id in crypto_ids}
+
+    def describe_signal(self, crypto_id: str, indicators_df: pd.DataFrame) -> str:
+        """
+        Turn the latest signal of an indicator DataFrame into a short textual assessment.
+
+        :param crypto_id: The ID of the cryptocurrency the indicators belong to.
+        :param indicators_df: The DataFrame returned by calculate_technical_indicators.
+        :return: A string indicating "Bullish", "Bearish", or "Neutral".
+        """
+        if indicators_df.empty:
+            return "No data available to determine a trend."
+
+        latest_row = indicators_df.iloc[-1]
 
         if latest_row['signal'] == 'Bullish Signal':
             return f"Bullish outlook for {crypto_id} based on RSI signal."
@@ -492,86 +912,127 @@ class OmniDB:
         else:
             return f"Neutral signals for {crypto_id} at the moment."
     
-    def analyze_all_bull_bear(self):
+    def analyze_all_bull_bear(self, batch_size: int = 500):
         """
         A method to analyze_crypto_bull_bear for all cryptocurrencies in Omni DB currently.
 
         This is essentially just a way for us to batch update the indicators for a more accurate analysis. 
+        The cryptos go through analyze_crypto_bull_bear_batch in chunks, so each chunk costs one read and one write.
+
+        :param batch_size: Number of cryptocurrencies analyzed per batch.
+        :return: The number of cryptocurrencies analyzed.
         """
         query = """
-            SELECT *
-            FROM cryptocurrencies;
+            SELECT id
+            FROM cryptocurrency;
         """
         with self.sqlite_connect() as cursor:
             cursor.execute(query)
-            rows = cursor.fetchall()
-            if rows:
-                df = pd.DataFrame([rows], columns=[desc[0] for desc in cursor.description])
-                self.logger.info(f"SELECT query on 'cryptocurrencies' was successful!")
+            crypto_ids = [row[0] for row in cursor.fetchall()]
+            if crypto_ids:
+                self.logger.info(f"SELECT query on 'cryptocurrency' was successful!")
             else:
-                print(f"No data returned from query: {query}")
+                self.logger.warning(f"No data returned from query: {query}")
                 return 0
 
-        for crypto_id in df["id"]:
-            self.analyze_crypto_bull_bear(crypto_id)
+        for start in range(0, len(crypto_ids), batch_size):
+            self.analyze_crypto_bull_bear_batch(crypto_ids[start:start + batch_size])
+
+        return len(crypto_ids)
         
 #############################################
 ################ NEWS TABLES ################
 #############################################
 
-    def get_source_id(self, source_name):
+    def get_source_id(self, source_name, cursor=None):
         """
         Get the ID for a news source, creating it if it doesn't exist.
         
         :param source_name: Name of the news source (e.g., 'Reuters', 'Yahoo Finance')
+        :param cursor: An open cursor to run in the caller's transaction (optional)
         :return: The ID of the source
         """
-        with self.sqlite_connect() as cursor:
-            # Try to get existing source
-            cursor.execute("SELECT id FROM news_sources WHERE name = ?", (source_name,))
-            result = cursor.fetchone()
-            
-            if result:
-                return result[0]
-            
-            # Create new source if it doesn't exist
-            cursor.execute(
-                "INSERT INTO news_sources (name) VALUES (?)",
-                (source_name,)
-            )
-            self.logger.info(f"Created new news source: {source_name}")
-            return cursor.lastrowid
+        source_id = self._cached_news_id("news_sources", source_name)
+        if source_id is not None:
+            return source_id
+
+        if cursor is None:
+            with self.sqlite_connect() as cursor:
+                return self.get_source_id(source_name, cursor=cursor)
+
+        # One round-trip whether or not the source exists; the no-op DO UPDATE is what makes
+        # RETURNING report the existing row (INSERT OR IGNORE would return nothing)
+        cursor.execute("""
+            INSERT INTO news_sources (name) VALUES (?)
+            ON CONFLICT(name) DO UPDATE SET name = excluded.name
+            RETURNING id
+        """, (source_name,))
+        source_id = cursor.fetchone()[0]
+        self._pending_news_ids()[("news_sources", source_name)] = source_id
+        return source_id
         
     ################
     # READ Methods
     ################
 
-    def get_category_id(self, category_name):
+    def get_category_id(self, category_name, cursor=None):
         """
         Get the ID for a news category, creating it if it doesn't exist.
         
         :param category_name: Name of the category (e.g., 'Business', 'Technology')
+        :param cursor: An open cursor to run in the caller's transaction (optional)
         :return: The ID of the category
         """
         if not category_name or category_name.strip() == '':
             return None
         
-        with self.sqlite_connect() as cursor:
-            # Try to get existing category
-            cursor.execute("SELECT id FROM news_categories WHERE name = ?", (category_name,))
-            result = cursor.fetchone()
-            
-            if result:
-                return result[0]
-            
-        with self.sqlite_connect() as cursor:
-            # Create new category if it doesn't exist
-            cursor.execute(
-                "INSERT INTO news_categories (name) VALUES (?)",
-                (category_name,)
-            )
-            self.logger.info(f"Created new news category: {category_name}")
-            return cursor.lastrowid
+        category_id = self._cached_news_id("news_categories", category_name)
+        if category_id is not None:
+            return category_id
+
+        if cursor is None:
+            with self.sqlite_connect() as cursor:
+                return self.get_category_id(category_name, cursor=cursor)
+
+        # Same single upsert as get_source_id
+        cursor.execute("""
+            INSERT INTO news_categories (name) VALUES (?)
+            ON CONFLICT(name) DO UPDATE SET name = excluded.name
+            RETURNING id
+        """, (category_name,))
+        category_id = cursor.fetchone()[0]
+        self._pending_news_ids()[("news_categories", category_name)] = category_id
+        return category_id
+
+    def get_category_ids(self, category_names, cursor=None):
+        """
+        Get the IDs for several news categories at once, creating the ones that don't exist.
+
+        :param category_names: Names of the categories; blank names are skipped
+        :param cursor: An open cursor to run in the caller's transaction (optional)
+        :return: A dictionary of category name -> ID, in the order the names were given
+        """
+        names = list(dict.fromkeys(name for name in category_names if name and name.strip()))
+        if not names:
+            return {}
+
+        ids = {name: self._cached_news_id("news_categories", name) for name in names}
+        ids = {name: category_id for name, category_id in ids.items() if category_id is not None}
+        missing = [name for name in names if name not in ids]
+        if not missing:
+            return {name: ids[name] for name in names}
+
+        if cursor is None:
+            with self.sqlite_connect() as cursor:
+                return self.get_category_ids(names, cursor=cursor)
+
+        cursor.executemany("INSERT OR IGNORE INTO news_categories (name) VALUES (?)", [(name,) for name in missing])
+        placeholders = ", ".join("?" * len(missing))
+        cursor.execute(f"SELECT name, id FROM news_categories WHERE name IN ({placeholders})", missing)
+        fetched = dict(cursor.fetchall())
+        self._pending_news_ids().update((("news_categories", name), category_id) for name, category_id in fetched.items())
+        ids.update(fetched)
+        return {name: ids[name] for name in names}
 
     def get_recent_articles(self, limit=50, source=None, category=None):
         """
@@ -711,11 +1172,12 @@ class OmniDB:
             self.logger.warning("Cannot store article without URL and title")
             return None
         
-        # Get or create source
-        source_id = self.get_source_id(source_name)
-        
-        # Check if article already exists
+        # The source, the article and its categories are written in one transaction (one commit per article)
         with self.sqlite_connect() as cursor:
+            # Get or create source
+            source_id = self.get_source_id(source_name, cursor=cursor)
+
+            # Check if article already exists
             cursor.execute("SELECT id FROM news_articles WHERE url = ?", (url,))
             existing = cursor.fetchone()
             
@@ -750,20 +1212,17 @@ class OmniDB:
                 article_id = cursor.lastrowid
                 self.logger.info(f"Inserted new article: {title}")
             
-        with self.sqlite_connect() as cursor:
             # Process categories if provided
             if categories and isinstance(categories, list):
                 # Clear existing categories for this article
                 cursor.execute("DELETE FROM article_categories WHERE article_id = ?", (article_id,))
                 
                 # Add new categories
-                for category_name in categories:
-                    category_id = self.get_category_id(category_name)
-                    if category_id:
-                        cursor.execute("""
-                            INSERT INTO article_categories (article_id, category_id)
-                            VALUES (?, ?)
-                        """, (article_id, category_id))
+                category_ids = self.get_category_ids(categories, cursor=cursor)
+                cursor.executemany("""
+                    INSERT INTO article_categories (article_id, category_id)
+                    VALUES (?, ?)
+                """, [(article_id, category_id) for category_id in category_ids.values()])
         
         return article_id
     
@@ -887,13 +1346,7 @@ class OmniDB:
                     continue
                     
                 # Get source ID
-                cursor.execute("SELECT id FROM news_sources WHERE name = ?", ('Yahoo Finance',))
-                result = cursor.fetchone()
-                if result:
-                    source_id = result[0]
-                else:
-                    cursor.execute("INSERT INTO news_sources (name) VALUES (?)", ('Yahoo Finance',))
-                    source_id = cursor.lastrowid
+                source_id = self.get_source_id('Yahoo Finance', cursor=cursor)
                 
                 # Check if article exists
                 cursor.execute("SELECT id FROM news_articles WHERE url = ?", (url,))
@@ -921,13 +1374,7 @@ class OmniDB:
                     article_id = cursor.lastrowid
                 
                 # Add default Finance category
-                cursor.execute("SELECT id FROM news_categories WHERE name = ?", ('Finance',))
-                result = cursor.fetchone()
-                if result:
-                    category_id = result[0]
-                else:
-                    cursor.execute("INSERT INTO news_categories (name) VALUES (?)", ('Finance',))
-                    category_id = cursor.lastrowid
+                category_id = self.get_category_id('Finance', cursor=cursor)
                     
                 # Clear existing categories
                 cursor.execute("DELETE FROM article_categories WHERE article_id = ?", (article_id,))
@@ -955,9 +1402,8 @@ class OmniDB:
                 if not url or not title:
                     continue
                     
-                # Get source IDs
-                cursor.execute("SELECT id from news_sources WHERE name = ?", ('Reuters',))
-                source_id = cursor.fetchone()
+                # Get source ID
+                source_id = self.get_source_id('Reuters', cursor=cursor)
                 
                 # Check if article exists
                 cursor.execute("SELECT id FROM news_articles WHERE url = ?", (url,))
@@ -976,14 +1422,14 @@ class OmniDB:
                             image_alt = ?,
                             fetch_date = CURRENT_TIMESTAMP
                         WHERE id = ?
-                    """, (title, source_id[0], published_date, summary, image_url, image_alt, article_id))
+                    """, (title, source_id, published_date, summary, image_url, image_alt, article_id))
                 else:
                     # Insert new article
                     cursor.execute("""
                         INSERT INTO news_articles (
                             title, url, source_id, published_date, summary, image_url, image_alt, fetch_date
                         ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    """, (title, url, source_id[0], published_date, summary, image_url, image_alt))
+                    """, (title, url, source_id, published_date, summary, image_url, image_alt))
                     
                     article_id = cursor.lastrowid
                 
@@ -992,13 +1438,7 @@ class OmniDB:
                     category_name = article.get('category')
                     
                     # Get category ID
-                    cursor.execute("SELECT id FROM news_categories WHERE name = ?", (category_name,))
-                    result = cursor.fetchone()
-                    if result:
-                        category_id = result[0]
-                    else:
-                        cursor.execute("INSERT INTO news_categories (name) VALUES (?)", (category_name,))
-                        category_id = cursor.lastrowid
+                    category_id = self.get_category_id(category_name, cursor=cursor)
                     
                     # Clear existing categories
                     cursor.execute("DELETE FROM article_categories WHERE article_id = ?", (article_id,))
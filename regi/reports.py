@@ -15,23 +15,20 @@ import os
 import sys
 import argparse
 import pandas as pd
-import numpy as np
 import datetime
 import sqlite3
 import logging
-import logging.config
-import json
-from pathlib import Path
 
-# Ensure we can import from the regi package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Ensure we can import from the regi package (only needed when this file is run as a script)
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import REGI modules
-from regi.omnidb import OmniDB, get_logging_config
+from regi.omnidb import OmniDB
+from regi.utils import configure_logging
 
 # Set up logging
-logconfig = get_logging_config()
-logging.config.dictConfig(logconfig)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 class ReportGenerator:
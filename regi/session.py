@@ -1,27 +1,29 @@
-import os, json 
-from fake_useragent import UserAgent, FakeUserAgent
+from fake_useragent import UserAgent
 from requests.exceptions import ConnectionError, Timeout, TooManyRedirects
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import requests
 import datetime
 import time, random
+import functools
 import logging 
-import logging.config
 
-def get_logging_config() -> dict:
-    jpath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config/loggingConfig.json")
-    config_dict = None
-    with open(jpath, 'r') as f:
-        config_dict = json.load(f)
+from regi.utils import configure_logging
 
-    return config_dict
+@functools.lru_cache(maxsize=1)
+def get_user_agent() -> UserAgent:
+    """
+        Build the UserAgent pool once per process (constructing it loads and indexes the bundled browser data)
+    """
+    return UserAgent()
 
 class RequestSession():
-    def __init__(self, headers=None):
+    def __init__(self, headers=None, pool_maxsize=10, retries=3):
         print(f"\n[REQUEST SESSION] - {datetime.datetime.now()} - Initializing the session now...")
      # Configuration
         if headers == None:
             headers = {
-                    "User-Agent": UserAgent().random,
+                    "User-Agent": get_user_agent().random,
                     "Accept-Language": "en-US,en;q=0.9",
                     "Referer": "https://www.google.com/",
                     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
@@ -29,24 +31,30 @@ class RequestSession():
         self.session = requests.Session()
         self.session.headers.update(headers)
 
+     # Keep-alive connection pool, sized for the number of requests a caller runs concurrently.
+     # Transient failures (dropped connections, 429/5xx) are retried with backoff before get() gives up.
+        retry = Retry(total=retries, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
      # Configure the logger
-        logconfig = get_logging_config()
-        logging.config.dictConfig(logconfig)
+        configure_logging()
         
      # Instantiate the logger
         self.logger = logging.getLogger(__name__)
         self.logger.info("Logging has been configured using the JSON file.")
 
 
-    def get(self, url: str|bytes, params=None) -> bytes:
+    def get(self, url: str|bytes, params=None, timeout=10) -> bytes:
         time.sleep(random.uniform(2, 5))
 
     # Make the HTTP request
         try:
             if params:
-                response = self.session.get(url, params=params)
+                response = self.session.get(url, params=params, timeout=timeout)
             else:
-                response = self.session.get(url)
+                response = self.session.get(url, timeout=timeout)
 
             if response.status_code != 200:
                 print(f"Failed to fetch page, status code: {response.status_code}")
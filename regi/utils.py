@@ -0,0 +1,61 @@
+import os
+import json
+import functools
+import logging
+import logging.config
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module when orjson isn't installed
+    orjson = None
+
+_LOG_CONFIGURED = False
+TS_FMT = '%Y%m%d_%H%M%S'  # Timestamp in the names of saved data, report and log files
+
+@functools.lru_cache(maxsize=1)
+def get_logging_config() -> dict:
+    """
+    Retrieve the logging configuration from a JSON file.
+
+    :return: A dictionary that can be used to configure logging for the module.
+    """
+    jpath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config/loggingConfig.json")
+    with open(jpath, 'r') as f:
+        config_dict = json.load(f)
+    return config_dict
+
+def configure_logging() -> None:
+    """
+    Apply config/loggingConfig.json with dictConfig, once per process. Every module and class that used to
+    call dictConfig itself goes through here, so later instances don't rebuild the handlers each time.
+
+    :return: None
+    """
+    global _LOG_CONFIGURED
+    if not _LOG_CONFIGURED:
+        logging.config.dictConfig(get_logging_config())
+        _LOG_CONFIGURED = True
+
+def json_loads(data):
+    """
+    Parse a JSON document, with orjson when it is installed (it parses raw bytes directly, no decode to str first).
+
+    :param data: The JSON document as bytes or str
+    :return: The parsed Python object
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, with orjson when it is installed (NumPy values are then encoded natively).
+
+    :param obj: The object to serialize
+    :param indent: Pretty-print with a two-space indent
+    :return: The JSON document as bytes, ready to write to a file opened in binary mode
+    """
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
@@ -1,4 +1,4 @@
-import sys, os 
+import sys
 
 # Add modules from base repo
 from pathlib import Path
@@ -6,7 +6,6 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from regi.news_scraper import RegiNewsScraper
 from regi.crypto import Crypto 
-from regi.SEC import SEC 
 from regi.omnidb import OmniDB
 
 